@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Body
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
-from app.core.pc_builder import get_pc_builder_instance
+from app.core.pc_builder import get_pc_builder_instance, PCBuild
 
 router = APIRouter()
 
@@ -9,6 +9,10 @@ class BuildRequest(BaseModel):
     budget: float
     usage: str = "general"  # gaming, work, content, general
     priorities: Dict[str, int] = {}
+    include_alternatives: bool = False
+    alternatives_count: int = 3
+    price_window: float = 0.3  # fraction of each part's price
+    max_price_delta: Dict[str, float] = {}  # absolute per-slot overrides
 
 class BuildComponent(BaseModel):
     name: str
@@ -20,6 +24,26 @@ class BuildResponse(BaseModel):
     components: List[BuildComponent]
     total_price: float
     compatibility_issues: List[Dict[str, Any]] = []
+    alternatives: Optional[Dict[str, List[BuildComponent]]] = None
+
+class AlternativesRequest(BaseModel):
+    components: List[BuildComponent]
+    slot: str
+    usage: str = "general"
+    count: int = 3
+    price_window: float = 0.3  # fraction of the current part's price
+    max_price_delta: Optional[float] = None
+
+def to_build_component(component_type: str, component_info: Dict[str, Any]) -> BuildComponent:
+    # Extract specs (everything except name and price)
+    specs = {k: v for k, v in component_info.items() if k not in ["name", "price"]}
+
+    return BuildComponent(
+        name=component_info.get("name", "Unknown"),
+        type=component_type,
+        price=component_info.get("price", 0),
+        specs=specs
+    )
 
 @router.post("/optimize", response_model=BuildResponse)
 async def optimize_build(request: BuildRequest):
@@ -39,22 +63,30 @@ async def optimize_build(request: BuildRequest):
         compatibility_issues = pc_builder.compatibility_checker.check_build_compatibility(build)
         
         # Convert to response format
-        components = []
-        for component_type, component_info in build.components.items():
-            # Extract specs (everything except name and price)
-            specs = {k: v for k, v in component_info.items() if k not in ["name", "price"]}
-            
-            components.append(BuildComponent(
-                name=component_info.get("name", "Unknown"),
-                type=component_type,
-                price=component_info.get("price", 0),
-                specs=specs
-            ))
+        components = [
+            to_build_component(component_type, component_info)
+            for component_type, component_info in build.components.items()
+        ]
+
+        # Ranked replacements per slot, only when asked for
+        alternatives = None
+        if request.include_alternatives:
+            alternatives = {
+                component_type: [
+                    to_build_component(component_type, alternative)
+                    for alternative in pc_builder.budget_optimizer.find_alternatives(
+                        build, component_type, request.alternatives_count,
+                        request.max_price_delta.get(component_type), request.usage,
+                        price_window=request.price_window)
+                ]
+                for component_type in build.components
+            }
         
         return BuildResponse(
             components=components,
             total_price=build.total_price,
-            compatibility_issues=compatibility_issues
+            compatibility_issues=compatibility_issues,
+            alternatives=alternatives
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -68,4 +100,22 @@ async def check_compatibility():
         issues = pc_builder.compatibility_checker.check_build_compatibility(pc_builder.current_build)
         return issues
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/alternatives", response_model=List[BuildComponent])
+async def get_alternatives(request: AlternativesRequest):
+    pc_builder = get_pc_builder_instance()
+    
+    try:
+        # Rebuild the client's build so the slot can be swapped without re-optimizing
+        build = PCBuild()
+        for component in request.components:
+            build.add_component(component.type, {
+                **component.specs, "name": component.name, "price": component.price})
+        
+        alternatives = pc_builder.budget_optimizer.find_alternatives(
+            build, request.slot, request.count, request.max_price_delta, request.usage,
+            price_window=request.price_window)
+        return [to_build_component(request.slot, alternative) for alternative in alternatives]
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from typing import Dict, Any, Optional
 import uuid
-from app.core.pc_builder import get_pc_builder_instance
+from app.core.pc_builder import get_pc_builder_instance, usage_profile
 
 router = APIRouter()
 
@@ -41,7 +41,9 @@ async def process_message(request: ChatRequest):
                 budget = 1300
                 if budget_str:
                     budget = int(re.sub(r'[^\d]', '', budget_str))
-                preferences = {"usage": "general", "priority": {}}
+                # Rank parts with the scores of the profile named in the message, if any
+                preferences = {"usage": usage_profile(
+                    request.message), "priority": {}}
                 build = pc_builder.budget_optimizer.optimize_build(
                     budget=budget, preferences=preferences)
                 components = {}
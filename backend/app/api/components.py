@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 from app.core.pc_builder import get_pc_builder_instance
@@ -46,20 +47,21 @@ async def get_components(
     try:
         df = pc_builder.processor.filter_components(component_type, filters)
 
-        # Convert to list of components
+        # Convert to list of components. Records are already normalized at
+        # catalog load, so they are serialized directly instead of being
+        # validated again through the response model.
         components = []
-        for _, row in df.iterrows():
-            data = row.to_dict()
+        for data in pc_builder.processor.get_component_records(component_type, df.index):
             price = data.pop("price", 0)
             name = data.pop("name", "Unknown Component")
 
-            components.append(Component(
-                name=name,
-                type=component_type,
-                price=price,
-                specs=data
-            ))
+            components.append({
+                "name": name,
+                "type": component_type,
+                "price": price or 0,
+                "specs": data
+            })
 
-        return components
+        return ORJSONResponse(components)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
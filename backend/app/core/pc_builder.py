@@ -7,9 +7,11 @@ from langchain_huggingface import HuggingFaceEmbeddings
 import os
 import pandas as pd
 import glob
+import heapq
+import copy
 from typing import List, Dict, Any, Optional, Tuple
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import pickle
 
 # Configure logger
@@ -39,6 +41,62 @@ def get_pc_builder_instance() -> 'PCBuilderRAG':
     return _pc_builder
 
 
+# Per usage profile, per category weights for the spec features used by
+# PerformanceScorer. Categories without weights (case, cpu-cooler) are left
+# unscored.
+DEFAULT_SCORE_WEIGHTS: Dict[str, Dict[str, Dict[str, float]]] = {
+    "general": {
+        "cpu": {"core_count": 0.5, "clock": 0.5},
+        "video-card": {"memory": 0.5, "clock": 0.5},
+        "memory": {"capacity": 0.6, "speed": 0.4},
+        "motherboard": {"max_memory": 0.6, "memory_slots": 0.4},
+        "internal-hard-drive": {"capacity": 0.6, "ssd": 0.4},
+        "power-supply": {"wattage": 0.5, "efficiency": 0.5},
+    },
+    "gaming": {
+        "cpu": {"core_count": 0.3, "clock": 0.7},
+        "video-card": {"memory": 0.4, "clock": 0.6},
+        "memory": {"capacity": 0.4, "speed": 0.6},
+        "motherboard": {"max_memory": 0.5, "memory_slots": 0.5},
+        "internal-hard-drive": {"capacity": 0.4, "ssd": 0.6},
+        "power-supply": {"wattage": 0.6, "efficiency": 0.4},
+    },
+    "workstation": {
+        "cpu": {"core_count": 0.7, "clock": 0.3},
+        "video-card": {"memory": 0.7, "clock": 0.3},
+        "memory": {"capacity": 0.8, "speed": 0.2},
+        "motherboard": {"max_memory": 0.7, "memory_slots": 0.3},
+        "internal-hard-drive": {"capacity": 0.7, "ssd": 0.3},
+        "power-supply": {"wattage": 0.4, "efficiency": 0.6},
+    },
+}
+
+# 80 PLUS certification levels, lowest to highest
+PSU_EFFICIENCY_TIERS: Dict[str, int] = {
+    "plus": 1,
+    "bronze": 2,
+    "silver": 3,
+    "gold": 4,
+    "platinum": 5,
+    "titanium": 6,
+}
+
+
+def usage_profile(usage: str) -> str:
+    """Map a free-form usage string to a scoring profile"""
+    usage = usage.lower()
+    if 'gaming' in usage:
+        return "gaming"
+    if 'workstation' in usage or 'productivity' in usage:
+        return "workstation"
+    return "general"
+
+
+def score_column(profile: str) -> str:
+    """Name of the precomputed score column for a usage profile"""
+    return f"score_{profile}"
+
+
 @dataclass
 class PCBuilderConfig:
     csv_dir: str = "../csv"
@@ -49,6 +107,87 @@ class PCBuilderConfig:
     persist_directory: str = "../chroma_db"
     temperature: float = 0.2
     api_key: Optional[str] = None
+    score_weights: Dict[str, Dict[str, Dict[str, float]]] = field(
+        default_factory=lambda: copy.deepcopy(DEFAULT_SCORE_WEIGHTS))
+
+# Performance scorer
+
+
+class PerformanceScorer:
+    def __init__(self, weights: Dict[str, Dict[str, Dict[str, float]]]):
+        self.weights = weights
+
+    @staticmethod
+    def _numeric(df: pd.DataFrame, column: str) -> pd.Series:
+        """Return a column as floats, or all NaN if it is missing"""
+        if column not in df.columns:
+            return pd.Series(float('nan'), index=df.index)
+        return pd.to_numeric(df[column], errors='coerce')
+
+    @staticmethod
+    def _split_numeric(df: pd.DataFrame, column: str) -> pd.DataFrame:
+        """Split "<a>,<b>" columns such as memory modules and speed into floats"""
+        parts = df[column].astype(str).str.split(',', n=1, expand=True)
+        return parts.apply(pd.to_numeric, errors='coerce')
+
+    def _features(self, component_type: str, df: pd.DataFrame) -> pd.DataFrame:
+        """Extract the raw spec features scored for a category"""
+        features = {}
+
+        if component_type == "cpu":
+            features["core_count"] = self._numeric(df, 'core_count')
+            features["clock"] = self._numeric(df, 'boost_clock').fillna(
+                self._numeric(df, 'core_clock'))
+        elif component_type == "video-card":
+            features["memory"] = self._numeric(df, 'memory')
+            features["clock"] = self._numeric(df, 'boost_clock').fillna(
+                self._numeric(df, 'core_clock'))
+        elif component_type == "memory":
+            if 'modules' in df.columns:
+                modules = self._split_numeric(df, 'modules')
+                # Per row: "<count>,<size GB>", or just the total size without a count
+                features["capacity"] = modules[0]
+                if modules.shape[1] == 2:
+                    features["capacity"] = (modules[0] * modules[1]).fillna(modules[0])
+            if 'speed' in df.columns:
+                # Per row: "<DDR generation>,<MHz>", or just the MHz
+                features["speed"] = self._split_numeric(
+                    df, 'speed').ffill(axis=1).iloc[:, -1]
+        elif component_type == "motherboard":
+            features["max_memory"] = self._numeric(df, 'max_memory')
+            features["memory_slots"] = self._numeric(df, 'memory_slots')
+        elif component_type == "internal-hard-drive":
+            features["capacity"] = self._numeric(df, 'capacity')
+            if 'type' in df.columns:
+                features["ssd"] = (df['type'].astype(str).str.upper() == "SSD").astype(float)
+        elif component_type == "power-supply":
+            features["wattage"] = self._numeric(df, 'wattage')
+            if 'efficiency' in df.columns:
+                features["efficiency"] = df['efficiency'].astype(
+                    str).str.lower().map(PSU_EFFICIENCY_TIERS)
+
+        return pd.DataFrame(features, index=df.index)
+
+    def score(self, component_type: str, df: pd.DataFrame) -> pd.DataFrame:
+        """Return a score column in [0, 1] per usage profile, NaN for unscored categories"""
+        features = self._features(component_type, df)
+        # Scale each feature by its catalog maximum so weights are comparable
+        scaled = features / features.max().where(features.max() > 0)
+
+        scores = pd.DataFrame(index=df.index)
+        for profile, category_weights in self.weights.items():
+            weights = {column: weight for column, weight in category_weights.get(component_type, {}).items()
+                       if column in scaled.columns and scaled[column].notna().any()}
+
+            if weights:
+                score = sum(scaled[column].fillna(0) * weight for column, weight in weights.items()) \
+                    / sum(weights.values())
+            else:
+                score = float('nan')
+
+            scores[score_column(profile)] = score
+
+        return scores
 
 # Component data processor
 
@@ -56,7 +195,10 @@ class PCBuilderConfig:
 class ComponentDataProcessor:
     def __init__(self, config: PCBuilderConfig):
         self.config = config
+        self.scorer = PerformanceScorer(config.score_weights)
         self.component_data = {}
+        self.component_records = {}
+        self.component_scores = {}
         self.component_types = []
 
     def load_csv_data(self):
@@ -70,12 +212,34 @@ class ComponentDataProcessor:
             try:
                 df = pd.read_csv(file_path)
                 self.component_data[component_type] = df
+                self.component_records[component_type] = self._to_records(df)
+                # Kept apart from the data so scores stay out of specs and RAG text
+                self.component_scores[component_type] = self.scorer.score(
+                    component_type, df)
                 print(f"Loaded {component_type} data with {len(df)} entries")
             except Exception as e:
                 print(f"Error loading {component_type} data: {e}")
 
         return self.component_data
 
+    @staticmethod
+    def _to_records(df: pd.DataFrame) -> Dict[Any, Dict]:
+        """Convert rows to plain Python dicts keyed by index, with NaN replaced by None"""
+        clean = df.astype(object).where(df.notna(), None)
+        return dict(zip(df.index, clean.to_dict('records')))
+
+    def get_component_records(self, component_type: str, index: pd.Index) -> List[Dict]:
+        """Return the normalized rows for the given index labels"""
+        records = self.component_records.get(component_type, {})
+        return [dict(records[label]) for label in index]
+
+    def get_component_scores(self, component_type: str, profile: str, index: pd.Index) -> Optional[pd.Series]:
+        """Return the precomputed scores of a usage profile for the given index labels"""
+        scores = self.component_scores.get(component_type)
+        if scores is None or score_column(profile) not in scores.columns:
+            return None
+        return scores.loc[index, score_column(profile)]
+
     def get_component_info(self, component_type: str, component_name: str) -> Dict:
         """Get detailed information about a specific component"""
         if component_type not in self.component_data:
@@ -87,7 +251,7 @@ class ComponentDataProcessor:
         if len(component) == 0:
             return {"error": f"Component {component_name} not found in {component_type}"}
 
-        return component.iloc[0].to_dict()
+        return self.get_component_records(component_type, component.index[:1])[0]
 
     def filter_components(self, component_type: str, filters: Dict[str, Any]) -> pd.DataFrame:
         """Filter components based on specified criteria"""
@@ -222,8 +386,9 @@ class CompatibilityChecker:
 
 
 class BudgetOptimizer:
-    def __init__(self, component_data: Dict[str, pd.DataFrame]):
+    def __init__(self, component_data: Dict[str, pd.DataFrame], processor: ComponentDataProcessor):
         self.component_data = component_data
+        self.processor = processor
 
     def optimize_build(self, budget: float, preferences: Dict[str, Any]) -> PCBuild:
         """Optimize a PC build based on budget and preferences"""
@@ -257,15 +422,14 @@ class BudgetOptimizer:
         }
 
         # Adjust allocations based on preferences
-        if 'usage' in preferences:
-            usage = preferences['usage'].lower()
-            if 'gaming' in usage:
-                budget_allocation["video-card"] = 0.35
-                budget_allocation["cpu"] = 0.2
-            elif 'workstation' in usage or 'productivity' in usage:
-                budget_allocation["cpu"] = 0.3
-                budget_allocation["memory"] = 0.15
-                budget_allocation["video-card"] = 0.2
+        profile = usage_profile(preferences.get('usage', "general"))
+        if profile == "gaming":
+            budget_allocation["video-card"] = 0.35
+            budget_allocation["cpu"] = 0.2
+        elif profile == "workstation":
+            budget_allocation["cpu"] = 0.3
+            budget_allocation["memory"] = 0.15
+            budget_allocation["video-card"] = 0.2
 
         # Select components based on budget allocation
         for component_type in priority_components:
@@ -279,18 +443,93 @@ class BudgetOptimizer:
             # Get components within budget
             df = self.component_data[component_type]
             if 'price' in df.columns:
-                affordable_components = df[df['price'] <= component_budget].sort_values(
-                    'price', ascending=False)
+                affordable_components = df[df['price'] <= component_budget]
 
                 if not affordable_components.empty:
-                    # Select the best component within budget
-                    selected_component = affordable_components.iloc[0].to_dict(
-                    )
+                    scores = self.processor.get_component_scores(
+                        component_type, profile, affordable_components.index)
+                    if scores is not None and scores.notna().any():
+                        # Select the best scoring component within budget,
+                        # preferring the more expensive one on ties
+                        ranking = pd.DataFrame(
+                            {"score": scores, "price": affordable_components['price']})
+                        best = ranking.nlargest(1, ["score", "price"])
+                    else:
+                        # Unscored categories keep the most expensive part within budget
+                        best = affordable_components.nlargest(1, 'price')
+                    selected_component = self.processor.get_component_records(
+                        component_type, best.index)[0]
                     build.add_component(component_type, selected_component)
                     remaining_budget -= selected_component.get('price', 0)
 
         return build
 
+    def _compatible_candidates(self, build: PCBuild, component_type: str, df: pd.DataFrame) -> pd.DataFrame:
+        """Drop parts that would conflict with the rest of the build"""
+        cpu = build.components.get('cpu', {})
+        motherboard = build.components.get('motherboard', {})
+        memory = build.components.get('memory', {})
+
+        # Records keep missing specs as None, so check values rather than keys
+        if component_type == "cpu" and 'socket' in df.columns and motherboard.get('socket') is not None:
+            df = df[df['socket'] == motherboard['socket']]
+        elif component_type == "motherboard":
+            if 'socket' in df.columns and cpu.get('socket') is not None:
+                df = df[df['socket'] == cpu['socket']]
+            if 'memory_type' in df.columns and memory.get('type') is not None:
+                df = df[df['memory_type'] == memory['type']]
+        elif component_type == "memory" and 'type' in df.columns and motherboard.get('memory_type') is not None:
+            df = df[df['type'] == motherboard['memory_type']]
+
+        return df
+
+    def find_alternatives(self, build: PCBuild, component_type: str, top_n: int = 5,
+                          max_price_delta: Optional[float] = None, usage: str = "general",
+                          price_window: float = 0.3) -> List[Dict]:
+        """Return the top-N compatible replacements for a build slot, ranked by performance per dollar"""
+        if component_type not in self.component_data or top_n <= 0:
+            return []
+
+        df = self.component_data[component_type]
+        if 'price' not in df.columns:
+            return []
+
+        current = build.components.get(component_type, {})
+        df = df[df['price'] > 0]
+        if 'name' in df.columns and current.get('name') is not None:
+            df = df[df['name'] != current['name']]
+
+        # Stay within a price band around the current part: an absolute delta
+        # if given, otherwise a fraction of the current price
+        current_price = current.get('price') or 0
+        if max_price_delta is None and current_price > 0:
+            max_price_delta = current_price * price_window
+        if max_price_delta is not None:
+            df = df[(df['price'] - current_price).abs() <= max_price_delta]
+        df = self._compatible_candidates(build, component_type, df)
+        if df.empty:
+            return []
+
+        prices = df['price'].to_numpy(dtype=float)
+        scores = self.processor.get_component_scores(
+            component_type, usage_profile(usage), df.index)
+
+        # Partial selection: only the top N entries are ordered, not the whole slot
+        if scores is not None and scores.notna().any():
+            values = scores.to_numpy(dtype=float) / prices
+            ranked = heapq.nlargest(
+                top_n,
+                ((value, price, position) for position, (value, price) in enumerate(zip(values, prices))
+                 if value == value),
+            )
+            positions = [position for _, _, position in ranked]
+        else:
+            # Without scores there is no value signal, so offer the cheapest parts first
+            ranked = heapq.nsmallest(top_n, zip(prices, range(len(prices))))
+            positions = [position for _, position in ranked]
+
+        return self.processor.get_component_records(component_type, df.index[positions])
+
 # PC Builder RAG System - adapted for API use
 
 
@@ -300,7 +539,8 @@ class PCBuilderRAG:
         self.processor = ComponentDataProcessor(config)
         self.component_data = self.processor.load_csv_data()
         self.compatibility_checker = CompatibilityChecker(self.component_data)
-        self.budget_optimizer = BudgetOptimizer(self.component_data)
+        self.budget_optimizer = BudgetOptimizer(
+            self.component_data, self.processor)
         self.current_build = PCBuild()
         self.memories: Dict[str, ConversationBufferMemory] = {}
         self.setup_rag_system()
@@ -1,11 +1,13 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 
 load_dotenv()  # Load environment variables from .env file
 from fastapi.middleware.cors import CORSMiddleware
+from brotli_asgi import BrotliMiddleware
 from app.api import chat, components, builds
 
-app = FastAPI(title="PC Builder API")
+app = FastAPI(title="PC Builder API", default_response_class=ORJSONResponse)
 
 # Configure CORS for frontend
 app.add_middleware(
@@ -17,6 +19,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses (component lists, builds); falls back to gzip
+# for clients that do not accept brotli
+app.add_middleware(BrotliMiddleware, minimum_size=1000)
+
 # Include routers
 app.include_router(chat.router, prefix="/api/chat", tags=["chat"])
 app.include_router(components.router,